@@ -30,29 +30,202 @@ TODOs:
 
 # Standard library imports
 import os
-import json
 import copy
+import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson is much faster than the json package but it isn't required.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
 
 # Tool imports
 from local_config import LOCAL_ENV
 import utils
 
 
+# Matches the $subdir$ placeholders which reference directories in LOCAL_ENV.DIRECTORIES.
+_DIRECTORY_PLACEHOLDER = re.compile(r'\$([^$]+)\$')
+
+
+class LazyConfig(dict):
+    """
+    This class holds a parsed config dict and instantiates the objects in it on demand. Accessing
+    a sub-dict which defines an object (i.e. it has an 'object_' field), whether by key, get,
+    items, values, pop, or unpacking, instantiates the object, and its args, and stores it in the
+    'instance' field of that sub-dict. Sub-dicts are returned as LazyConfigs as well so the same
+    holds at every level. The 'instance' and 'object_' fields are returned as they are, even if
+    the object is a dict.
+
+    Each object is given a deep copy of its args, so an object which modifies its args doesn't
+    change the parsed (or raw) config the LazyConfig was made from.
+    """
+
+    # These hold the instantiated object and its class, not config, so they are never wrapped.
+    UNWRAPPED_KEYS = ('instance', 'object_')
+
+    __slots__ = ('_materialized',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._materialized = False
+
+    def __getitem__(self, key):
+        value = self._wrap(key)
+        if isinstance(value, LazyConfig):
+            value._instantiate()
+
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+
+        return default
+
+    def __iter__(self):
+        # Overriding this makes dict(...), {**...}, and ** unpacking go through keys() and
+        # __getitem__ rather than copying the stored values directly.
+        return super().__iter__()
+
+    def values(self):
+        return [self[k] for k in self.keys()]
+
+    def items(self):
+        return [(k, self[k]) for k in self.keys()]
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            super().pop(key)
+            return value
+
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key = next(reversed(self.keys()))
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            super().__setitem__(key, default)
+
+        return self[key]
+
+    def _wrap(self, key):
+        """
+        Replace a sub-dict with a LazyConfig copy of it.
+
+        Args:
+            key:    Key of the value to return.
+
+        Returns:
+            The value at key. If it is a plain dict from the config, then it is a LazyConfig.
+        """
+
+        value = super().__getitem__(key)
+        if type(value) is dict and key not in self.UNWRAPPED_KEYS:
+            value = LazyConfig(value)
+            super().__setitem__(key, value)
+
+        return value
+
+    def _instantiate(self):
+        """
+        Instantiate the object defined by this config, if it defines one and it hasn't been
+        instantiated yet.
+
+        Returns:
+            N/A - the 'instance' field is set.
+        """
+
+        object_ = super().get('object_')
+        if object_ is None or 'instance' in self:
+            return
+
+        # The args are often objects, so instantiate them first.
+        args = self._wrap('args').materialize()
+
+        # The args share their lists, etc. with the parsed config, so copy them before handing
+        # them over. The objects in the args are passed as they are rather than copied.
+        memo = {}
+        stack = [args]
+        while len(stack) > 0:
+            config = stack.pop()
+            for k, v in dict.items(config):
+                if k == 'instance':
+                    memo[id(v)] = v
+                elif k not in self.UNWRAPPED_KEYS and isinstance(v, dict):
+                    stack.append(v)
+
+        super().__setitem__('instance', object_(**copy.deepcopy(args, memo)))
+
+    def materialize(self) -> 'LazyConfig':
+        """
+        Instantiate every object in this config.
+
+        Returns:
+            (LazyConfig)    self, with all objects instantiated.
+        """
+
+        if self._materialized is True:
+            return self
+
+        stack = [self]
+        configs = []
+        while len(stack) > 0:
+            config = stack.pop()
+            configs.append(config)
+            for k in list(config.keys()):
+                if k in self.UNWRAPPED_KEYS:
+                    continue
+
+                value = config._wrap(k)
+                if isinstance(value, LazyConfig) and value._materialized is False:
+                    stack.append(value)
+
+        # Objects nested in the args of another object are always collected after it, so go in
+        # reverse order.
+        for config in reversed(configs):
+            config._instantiate()
+            config._materialized = True
+
+        return self
+
+
 class Config:
     """
     This class reads in a json config file, recursively parses it to populate all reference, and
     finally instantitates any classes that are requested.
 
     The raw property provided the raw contents of the config file. The parsed property provides the
-    recursively parsed config with all references populated. The instantiated property provides the
-    config will all requested objects instantiated. The only purpose of the raw property is to double
-    the correct file was loaded. The parsed property is really about producing a static config file
-    without references for reproduceability reasons. The instantiated property is what should be
-    used almost always.
+    recursively parsed config with all references populated. The lazy property provides the config
+    which instantiates the requested objects as they are accessed. The instantiated property
+    provides the config will all requested objects instantiated. The only purpose of the raw
+    property is to double the correct file was loaded. The parsed property is really about
+    producing a static config file without references for reproduceability reasons. The lazy
+    property is what should be used almost always.
     """
 
     COMMENT_PREFIX = '__'
     REFERENCE_IDENTIFIER = '$'
+    RESOLVED_TAG = '__resolved__'
+
+    __slots__ = (
+        '_inputs',
+        '_config_file',
+        '_raw_config',
+        '_parsed_config',
+        '_instantiated',
+        '_file_cache',
+    )
+
+    # Classes loaded by parse_object keyed by (module, class). This is shared by all instances.
+    _class_cache: dict[tuple[str, str], type] = {}
 
     def __init__(self, config_file: str):
         """
@@ -63,7 +236,7 @@ class Config:
                             file to run.
         """
 
-        self._inputs = locals()
+        self._inputs = {'config_file': config_file}
 
         if config_file.find(os.sep) < 0:
             # This is just the file name with no path. Assume the path
@@ -72,6 +245,10 @@ class Config:
 
         self._config_file = config_file
         self._raw_config, self._parsed_config, self._instantiated = None, None, None
+
+        # Parsed json files keyed by their real path. The same reference file can be loaded many
+        # times during a fetch so only read and parse it once.
+        self._file_cache: dict[str, dict] = {}
         self.fetch()
 
     def __str__(self) -> str:
@@ -83,17 +260,54 @@ class Config:
     def __repr__(self) -> str:
         output = utils.strings.formatted_line(f'{self.__class__.__name__}(', tab_level=1)
         for k, v in self._inputs.items():
-            if k == 'self':
-                continue
-
             output += utils.strings.formatted_line(f'{k}={repr(v)}', tab_level=2)
 
         output += utils.strings.formatted_line(')', tab_level=1)
         return output
 
+    def _resolve_file_name(self, file_name: str) -> str:
+        """
+        Replace any directory placeholders in the file name and resolve it to its real path.
+
+        Args:
+            file_name:  Full path and file name of the config file.
+
+        Returns:
+            (str) The real path of the config file.
+        """
+
+        # A $ pair means we are referencing a directory contained in LOCAL_ENV.DIRECTORIES.
+        # We need to swap out each placeholder for the directory in order to be able to load
+        # the file.
+        file_name = _DIRECTORY_PLACEHOLDER.sub(
+            lambda match: str(getattr(LOCAL_ENV.DIRECTORIES, match.group(1))),
+            file_name
+        )
+
+        return os.path.realpath(file_name)
+
+    def _read_json_file(self, file_name: str) -> dict:
+        """
+        Read the config file into the file cache unless it is already there.
+
+        Args:
+            file_name:  Real path of the config file, i.e. output of _resolve_file_name.
+
+        Returns:
+            (dict) The cached config dict. It must not be modified.
+        """
+
+        if file_name not in self._file_cache:
+            with open(file_name, 'rb') as f:
+                self._file_cache[file_name] = _json_loads(f.read())
+
+        return self._file_cache[file_name]
+
     def load_json_file(self, file_name: str) -> dict:
         """
-        Read the raw config file using the json package.
+        Read the raw config file using orjson, or the json package if orjson isn't installed.
+        Files are only read from disk once per instance. Every call returns a deep copy of the
+        cached dict since the callers modify it.
 
         Args:
             file_name:  Full path and file name of the config file.
@@ -102,25 +316,45 @@ class Config:
             (dict) The raw config dict unchanged from what is in the file.
         """
 
-        if self.REFERENCE_IDENTIFIER in file_name:
-            # The presence of a $ means we are referencing a directory contained in
-            # LOCAL_ENV.DIRECTORIES. We need to swap out that placeholder for the
-            # directory in order to be able to load the file.
-            subdir_name = utils.strings.extract_between(
-                full_str=file_name,
-                left=self.REFERENCE_IDENTIFIER,
-                right=self.REFERENCE_IDENTIFIER,
-                include=False
-            )
+        return copy.deepcopy(self._read_json_file(self._resolve_file_name(file_name)))
 
-            subdir = getattr(LOCAL_ENV.DIRECTORIES, subdir_name)
-            original_reference = f'{self.REFERENCE_IDENTIFIER}{subdir_name}{self.REFERENCE_IDENTIFIER}'
-            file_name = file_name.replace(original_reference, subdir)
+    def prefetch_references(self, config: dict):
+        """
+        Read all the files referenced by the config into the file cache. The files referenced
+        at the same depth are independent of each other, so they are read in parallel. That way
+        parsing the references afterwards doesn't have to wait on the disk.
 
-        with open(file_name) as f:
-            raw_config = json.load(f)
+        Args:
+            config:     Raw config dict, i.e. output of json.load on the config file.
+
+        Returns:
+            N/A - the file cache is populated.
+        """
 
-        return raw_config
+        configs = [config]
+        while len(configs) > 0:
+            # Collect the references of this round of configs.
+            file_names = set()
+            stack = list(configs)
+            while len(stack) > 0:
+                sub_config = stack.pop()
+                for k, v in sub_config.items():
+                    if k[:2] == self.COMMENT_PREFIX:
+                        continue
+
+                    if isinstance(v, dict):
+                        stack.append(v)
+                    elif k == 'reference':
+                        file_names.add(self._resolve_file_name(v))
+
+            file_names = [f for f in file_names if f not in self._file_cache]
+            if len(file_names) == 1:
+                configs = [self._read_json_file(file_names[0])]
+            elif len(file_names) > 1:
+                with ThreadPoolExecutor(max_workers=min(32, len(file_names))) as executor:
+                    configs = list(executor.map(self._read_json_file, file_names))
+            else:
+                configs = []
 
     def parse_object(self, object_config: dict) -> dict:
         """
@@ -138,8 +372,14 @@ class Config:
                 instantiated and the added to the dict in the "instance" field.
         """
 
+        # The same class is often used many times within a config, so only look it up once.
+        key = (object_config['module'], object_config['class'])
+        if key in self._class_cache:
+            object_config['object_'] = self._class_cache[key]
+            return object_config
+
         # Load the module and the specific class. Then instantiate the class.
-        module = __import__(object_config['module'], fromlist=[object_config['class']])
+        module = importlib.import_module(object_config['module'])
 
         try:
             # object = getattr(module, object_config['class'])
@@ -150,34 +390,72 @@ class Config:
             object_config['object_'] = None
             print(f'The following object did not get created. {object_config}')
 
+        self._class_cache[key] = object_config['object_']
+
         return object_config
 
-    def recursively_parse_references(self, config: dict) -> dict:
+    def _is_plain_data(self, config: dict) -> bool:
         """
-        The raw config dict is a series of nested dicts. Each sub-dict could define something
-        or reference another config file. This function recursively parses those nested
-        config dicts replacing references and instantiating objects so teh final output config
-        dict has everything that is needed.
+        Determine if a sub-dict is plain data, i.e. it has no reference and no sub-dicts which
+        could define objects or references. Plain data sub-dicts don't need to be parsed.
 
         Args:
-            config:     Raw config dict, i.e. output of json.load on the config file.
+            config:     Sub-dict of the config.
 
         Returns:
-            (dict)      Parsed config dict.
+            (bool)  True if this doesn't need parsing, False otherwise.
+        """
+
+        if 'reference' in config:
+            return False
+
+        for v in config.values():
+            if isinstance(v, dict):
+                return False
+
+        return True
+
+    def _parse_level(self, config: dict, items: list, stack: list, index: int) -> bool:
         """
+        Parse a single level of the config dict. Sub-dicts are copied into config and pushed onto
+        the stack to be parsed later rather than being parsed here.
+
+        Args:
+            config:     Shallow copy of the sub-dict being parsed. It is modified in place.
+            items:      The (key, value) pairs of the sub-dict to parse.
+            stack:      Sub-dicts which still need to be parsed. New sub-dicts are added to it.
+            index:      Index of config in the list of parsed sub-dicts. It is the parent index
+                        for all the sub-dicts added to the stack.
 
-        output_config = copy.deepcopy(config)
-        tmp = {}
-        for k, v in config.items():
+        Returns:
+            (bool)      True if any reference or object was parsed, False otherwise.
+        """
+
+        made_progress = False
+        for k, v in items:
             if k[:2] == self.COMMENT_PREFIX:
                 # Ignore comments.
                 continue
 
             if isinstance(v, dict):
+                if v.get(self.RESOLVED_TAG) is True:
+                    # Already fully parsed on a previous pass.
+                    config[k] = v
+                    continue
+
+                # Copy so the input is left untouched, then parse the copy later.
+                sub_config = dict(v)
+                if k != 'object' and self._is_plain_data(v):
+                    # Nothing in here to parse, e.g. split_percentages.
+                    config[k] = sub_config
+                    continue
+
                 if k == 'object':
-                    output_config[k] = self.recursively_parse_references(config=self.parse_object(v))
-                else:
-                    output_config[k] = self.recursively_parse_references(config=v)
+                    self.parse_object(sub_config)
+                    made_progress = True
+
+                config[k] = sub_config
+                stack.append((sub_config, list(v.items()), index))
             else:
                 if k == 'reference':
                     tmp = self.load_json_file(v)
@@ -186,79 +464,104 @@ class Config:
                     # instantiating the classes since the overrides are
                     # instantiation overrides. Also, do it before doing
                     # a recursive parsing of the dict so we have the final
-                    # dict before starting to instantiate objects.
-                    for ok, ov in config['override'].items():
-                        tmp['object']['args'][ok] = ov
+                    # dict before starting to instantiate objects. A missing or empty
+                    # override means there is nothing to do.
+                    override = config.get('override', {})
+                    if len(override) > 0:
+                        tmp['object']['args'].update(override)
 
-                    tmp = self.recursively_parse_references(config=tmp)
-                    for kk, vv in tmp.items():
-                        output_config[kk] = vv
+                    # The referenced file ends up merged into this level, so its sub-dicts are
+                    # children of this level. Only chains of references recurse here.
+                    self._parse_level(config=tmp, items=list(tmp.items()), stack=stack, index=index)
+                    config.update(tmp)
 
-                    output_config['source'] = v
-                    output_config.pop('reference', None)
+                    config['source'] = v
+                    config.pop('reference', None)
+                    made_progress = True
 
-        return output_config
+        return made_progress
 
-    def does_this_still_need_parsing(self, config: dict) -> bool:
+    def recursively_parse_references(self, config: dict) -> tuple[dict, bool, bool]:
         """
-        The json file config could lead to scenarios where "reference" leads to files
-        with other "reference" entries and "object" entries, etc. The recursion will
-        catch most of this but it sometimes will not.
+        The raw config dict is a series of nested dicts. Each sub-dict could define something
+        or reference another config file. This function parses those nested config dicts
+        replacing references and instantiating objects so teh final output config dict has
+        everything that is needed. The nested dicts are walked with a stack rather than by
+        recursion.
 
-        This function determines if the config dict still needs parsing.
+        The json file config could lead to scenarios where "reference" leads to files with other
+        "reference" entries and "object" entries, etc. The parsing will catch most of this but
+        it sometimes will not. So while parsing, this function also keeps track of whether the
+        config still needs parsing. Sub-dicts which are fully parsed are tagged so that another
+        pass over the config skips them.
 
         Args:
-            config:     Parsed config dict.
+            config:     Raw config dict, i.e. output of json.load on the config file.
 
         Returns:
-            (bool)  True if this still needs parsing, False otherwise.
+            (dict)      Parsed config dict.
+            (bool)      True if any reference or object was parsed, False otherwise.
+            (bool)      True if this still needs parsing, False otherwise.
         """
 
-        for k, v in config.items():
-            if k == 'reference':
-                return True
-
-            if k == 'object' and 'object_' not in v:
-                return True
-
-            if isinstance(v, dict):
-                v_result = self.does_this_still_need_parsing(v)
+        if config.get(self.RESOLVED_TAG) is True:
+            # Already fully parsed on a previous pass.
+            return config, False, False
+
+        # This is the only place the top-level dict is copied, so callers can pass in their config
+        # without copying it. A shallow copy of each sub-dict is enough. Every sub-dict that gets
+        # changed is replaced by its copy, and referenced files are fresh copies from load_json_file.
+        output_config = dict(config)
+
+        # Each stack entry is (sub-dict copy, items to parse, index of the parent sub-dict).
+        stack = [(output_config, list(config.items()), -1)]
+        parsed, parents, pending = [], [], []
+        made_progress = False
+        while len(stack) > 0:
+            sub_config, items, parent = stack.pop()
+            index = len(parsed)
+            parsed.append(sub_config)
+            parents.append(parent)
+
+            made_progress |= self._parse_level(config=sub_config, items=items, stack=stack, index=index)
+
+            object_config = sub_config.get('object')
+            pending.append(
+                'reference' in sub_config or
+                (isinstance(object_config, dict) and 'object_' not in object_config)
+            )
 
-                if v_result is True:
-                    return True
+        # Sub-dicts are always parsed after their parent, so walking backwards passes the
+        # pending state from the children up to their parents.
+        for index in range(len(parsed) - 1, -1, -1):
+            if pending[index] is True:
+                if parents[index] >= 0:
+                    pending[parents[index]] = True
+            else:
+                parsed[index][self.RESOLVED_TAG] = True
 
-        return False
+        return output_config, made_progress, pending[0]
 
-    def instantiate_objects(self, config: dict) -> dict:
+    def _remove_resolved_tags(self, config: dict):
         """
-        The json file config has been parsed and all object imports have been extracts. All
-        arg overrides have been applied.
-
-        This function instantiates the objects.
+        Once the config is fully parsed, the tags added by recursively_parse_references are no
+        longer needed. Remove them so they don't end up in the parsed config or the args passed
+        to the instantiated objects.
 
         Args:
-            config:     Parsed config dict.
+            config:     Parsed config dict. It is modified in place.
 
         Returns:
-            (dict)  config with the objects instantiated and a new field added to
-                    the 'object' fields. That new field is 'instance' and it holds
-                    the instantiated object.
+            N/A
         """
 
-        output_config = copy.deepcopy(config)
-        for k, v in config.items():
-            if isinstance(v, dict):
-                output_config[k] = self.instantiate_objects(v)
-
-            if k == 'object_':
-                if v is not None:
-                    # The args are often objects, so instantiate them first.
-                    output_config['args'] = self.instantiate_objects(output_config['args'])
-
-                    # Now instantiate the object with its args.
-                    output_config['instance'] = v(**output_config['args'])
-
-        return output_config
+        stack = [config]
+        while len(stack) > 0:
+            sub_config = stack.pop()
+            sub_config.pop(self.RESOLVED_TAG, None)
+            for k, v in sub_config.items():
+                if k[:2] != self.COMMENT_PREFIX and isinstance(v, dict):
+                    stack.append(v)
 
     def fetch(self) -> dict:
         """
@@ -270,15 +573,23 @@ class Config:
         """
 
         self._raw_config = self.load_json_file(file_name=self._config_file)
-        self._parsed_config = self.recursively_parse_references(config=copy.copy(self._raw_config))
+        self.prefetch_references(config=self._raw_config)
+
+        self._parsed_config, made_progress, still_pending = self.recursively_parse_references(
+            config=self._raw_config
+        )
 
         # Since the referencing within the config files could become reference to references to ...
-        # the parsing may need to happen more than once. Here I use an arbitrary number of
-        # iterations on the recursion.
-        while self.does_this_still_need_parsing(config=self._parsed_config) is True:
-            self._parsed_config = self.recursively_parse_references(config=copy.copy(self._parsed_config))
+        # the parsing may need to happen more than once. Keep going as long as something is left
+        # to parse and the last pass was able to parse anything at all.
+        while still_pending is True and made_progress is True:
+            self._parsed_config, made_progress, still_pending = self.recursively_parse_references(
+                config=self._parsed_config
+            )
 
-        self._instantiated = self.instantiate_objects(self._parsed_config)
+        self._remove_resolved_tags(config=self._parsed_config)
+        # Nothing is instantiated until it is accessed.
+        self._instantiated = LazyConfig(self._parsed_config)
 
     @property
     def file(self) -> str:
@@ -297,6 +608,12 @@ class Config:
         return self._parsed_config
 
     @property
-    def instantiated(self) -> dict:
-        # This is the one the code uses to perform the full run set.
-        return self._instantiated
\ No newline at end of file
+    def lazy(self) -> LazyConfig:
+        # This is the one the code uses to perform the full run set. Objects are only instantiated
+        # when they are accessed so parts of the config which aren't used cost nothing.
+        return self._instantiated
+
+    @property
+    def instantiated(self) -> LazyConfig:
+        # Same as lazy except every object in the config gets instantiated right away.
+        return self._instantiated.materialize()
\ No newline at end of file
@@ -37,13 +37,55 @@ TODOs:
 """
 
 # Standard library imports
+import os
+import glob
+import hashlib
+import numpy as np
 import pandas as pd
+import sklearn
 from sklearn.model_selection import StratifiedShuffleSplit
 
 # Tool imports
+from local_config import LOCAL_ENV
 import utils
 
 
+# Change this whenever _split_indices changes how the data is split so old cached splits aren't used.
+_SPLIT_CACHE_VERSION = 'v1'
+
+
+def _is_numeric(df: pd.DataFrame) -> bool:
+    """
+    Determine if every column in a DataFrame is numeric.
+
+    Args:
+        df:     The DataFrame to check.
+
+    Returns:
+        (bool)  True if all the columns are numeric, False otherwise.
+    """
+
+    return all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes)
+
+
+def _summarize(data: [pd.Series, pd.DataFrame]) -> str:
+    """
+    Summarize a Series or DataFrame by its shape and dtypes. This is much cheaper than info()
+    which also prints to stdout rather than returning the summary.
+
+    Args:
+        data:   The Series or DataFrame to summarize.
+
+    Returns:
+        (str)   The summary.
+    """
+
+    if isinstance(data, pd.DataFrame):
+        return f'shape={data.shape}, dtypes={data.dtypes.value_counts().to_dict()}'
+
+    return f'shape={data.shape}, dtype={data.dtype}'
+
+
 class SplitBase:
     """
     The SplitBase class is intended to hold one of the Training, Validation, or Testing splits of the dataset.
@@ -51,16 +93,34 @@ class SplitBase:
     API.
     """
 
+    __slots__ = (
+        '_inputs',
+        '_source',
+        '_title',
+        '_answers',
+        '_features_np',
+        '_feature_names',
+        '_index',
+        '_features',
+    )
+
     def __init__(
             self,
             source: str,
             title: str,
-            features: pd.DataFrame,
+            features: [pd.DataFrame, np.ndarray],
             answers: [pd.Series, pd.DataFrame, None],
+            feature_names: [list[str], None] = None,
+            index: [pd.Index, None] = None,
     ):
         """
         Instantiate the class.
 
+        Purely numeric features are stored as a single column-major float32 numpy array which
+        downstream code can use directly via the features_array property. The features property
+        wraps that array in a DataFrame without copying it. Features with any non-numeric column
+        are kept as the DataFrame that was provided.
+
         Args:
             source:     String describing how to find the data source. If this is a file on
                         a local hard drive, then this string is the full path and filename.
@@ -69,39 +129,69 @@ class SplitBase:
             title:      This is a descriptive string for the dataset. Its primary use-case is
                         as part of titles on analysis plots. It should be unique enough that
                         plots of other datasets cannot be confused with this dataset.
-            features:   This is a pandas DataFrame holding the features for the dataset.
-            answers:    For supervised learning, this is a pandas Series or DataFrame holding
-                        the correct answers for the dataset. The answer in row i in answers
-                        should be the answer to the instance in row i of features. When the
-                        dataset is not a supervised learning dataset, then this can be None.
+            features:       This is a pandas DataFrame or a 2D numpy array holding the features
+                            for the dataset.
+            answers:        For supervised learning, this is a pandas Series or DataFrame holding
+                            the correct answers for the dataset. The answer in row i in answers
+                            should be the answer to the instance in row i of features. When the
+                            dataset is not a supervised learning dataset, then this can be None.
+            feature_names:  The column headers of the features. Only used, and required, when
+                            features is a numpy array.
+            index:          The row index of the features. Only used when features is a numpy
+                            array. Defaults to a RangeIndex.
         """
 
-        self._inputs = locals()
+        # The features and answers are stored below, so don't hold another reference to them.
+        self._inputs = {'source': source, 'title': title}
 
         self._source = source
         self._title = title
-        self._features = features
         self._answers = answers
 
+        if isinstance(features, pd.DataFrame):
+            feature_names = list(features.columns)
+            index = features.index
+
+            if not _is_numeric(features):
+                # Keep the DataFrame as is since it can't be stored as a numeric array.
+                features_array = None
+            else:
+                features_array = features.to_numpy(dtype=np.float32)
+        else:
+            features_array = features
+            features = None
+
+        if features_array is not None:
+            features_array = np.asfortranarray(features_array, dtype=np.float32)
+
+        self._features_np = features_array
+        self._feature_names = feature_names
+        self._index = index
+        self._features = features
+
     def __str__(self) -> str:
         output = f'{self.__class__.__name__}:\n'
         output += utils.strings.formatted_line(f'Title: {self.title}', tab_level=1)
         output += utils.strings.formatted_line(f'Source: {self.source}', tab_level=1)
-        output += utils.strings.formatted_line(f'Features: {self.features.info()}', tab_level=1)
+        output += utils.strings.formatted_line(f'Features: {_summarize(self.features)}', tab_level=1)
 
         if self.answers is not None:
-            output += utils.strings.formatted_line(f'Answers: {self.answers.info()}', tab_level=1)
+            output += utils.strings.formatted_line(f'Answers: {_summarize(self.answers)}', tab_level=1)
 
         return output
 
     def __repr__(self) -> str:
         output = utils.strings.formatted_line(f'{self.__class__.__name__}(', tab_level=1)
         for k, v in self._inputs.items():
-            if k == 'self':
-                continue
-
             output += utils.strings.formatted_line(f'{k}={repr(v)}', tab_level=2)
 
+        # Only show the shapes of the data rather than all of it.
+        features_shape = self._features_np.shape if self._features is None else self._features.shape
+        output += utils.strings.formatted_line(f'features.shape={repr(features_shape)}', tab_level=2)
+
+        answers_shape = None if self._answers is None else self._answers.shape
+        output += utils.strings.formatted_line(f'answers.shape={repr(answers_shape)}', tab_level=2)
+
         output += utils.strings.formatted_line(')', tab_level=1)
         return output
 
@@ -111,8 +201,30 @@ class SplitBase:
 
     @property
     def features(self) -> pd.DataFrame:
+        # When every feature is numeric, all the columns are float32. Otherwise the dtypes are
+        # those of the DataFrame provided at instantiation.
+        if self._features is None:
+            # Wrap the numeric array without copying it.
+            self._features = pd.DataFrame(
+                self._features_np,
+                columns=self._feature_names,
+                index=self._index,
+                copy=False,
+            )
+
         return self._features
 
+    @property
+    def features_array(self) -> np.ndarray:
+        if self._features_np is None:
+            return self._features.to_numpy()
+
+        return self._features_np
+
+    @property
+    def feature_names(self) -> list[str]:
+        return self._feature_names
+
     @property
     def answers(self) -> [pd.Series, pd.DataFrame, None]:
         return self._answers
@@ -136,6 +248,22 @@ class DatasetBase:
     repeating potentially time-consuming calculations.
     """
 
+    __slots__ = (
+        '_inputs',
+        '_source',
+        '_title',
+        '_column_headers',
+        '_answers_column',
+        '_split_percentages',
+        '_full',
+        '_training',
+        '_validation',
+        '_testing',
+    )
+
+    # Maximum number of split indices kept in the cache directory.
+    SPLIT_CACHE_SIZE = 64
+
     def __init__(
             self,
             source: str,
@@ -161,7 +289,13 @@ class DatasetBase:
                                     key have a value [0, 1) and the sum of all values = 1.
         """
 
-        self._inputs = locals()
+        self._inputs = {
+            'source': source,
+            'title': title,
+            'column_headers': column_headers,
+            'answers_column': answers_column,
+            'split_percentages': split_percentages,
+        }
 
         self._source = source
         self._title = title
@@ -183,10 +317,9 @@ class DatasetBase:
 
     def __repr__(self) -> str:
         output = utils.strings.formatted_line(f'{self.__class__.__name__}(', tab_level=1)
-        for k, v in self._inputs.items():
-            if k == 'self':
-                continue
-
+        # Subclasses may store their inputs in a dataclass rather than a dict.
+        inputs = self._inputs if isinstance(self._inputs, dict) else vars(self._inputs)
+        for k, v in inputs.items():
             output += utils.strings.formatted_line(f'{k}={repr(v)}', tab_level=2)
 
         output += utils.strings.formatted_line(')', tab_level=1)
@@ -208,59 +341,207 @@ class DatasetBase:
         # Then call self._split().
         raise NotImplementedError
 
-    def _split(self):
+    def _downcast(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        This method splits the full dataset into the Training, Validation, and Testing datasets.
+        This method shrinks the dtypes of the feature columns. Floats become float32, integers
+        become the smallest integer type that holds them, and categoricals are replaced by their
+        integer codes (missing values are -1). The answers column is left as is.
+
+        Args:
+            df:     The dataset to downcast.
 
         Returns:
-            N/A - instance variables are set.
+            (pd.DataFrame)  The downcast dataset.
         """
 
-        # Only keep/split the data that was requested.
-        df = self._full[self._column_headers + [self._answers_column]]
+        features = df.drop(columns=self._answers_column, errors='ignore')
+
+        downcast_columns = {}
+        for col in features.select_dtypes(include='float64').columns:
+            downcast_columns[col] = df[col].astype(np.float32)
+
+        for col in features.select_dtypes(include='int64').columns:
+            downcast_columns[col] = pd.to_numeric(df[col], downcast='integer')
+
+        for col in features.select_dtypes(include='category').columns:
+            downcast_columns[col] = df[col].cat.codes
+
+        if len(downcast_columns) == 0:
+            return df
+
+        return df.assign(**downcast_columns)
+
+    def _split_indices(self, answers: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        This method determines which rows of the dataset go into the Training, Validation, and
+        Testing datasets.
+
+        Args:
+            answers:    The answers of the dataset to stratify the splits on.
+
+        Returns:
+            (np.ndarray)    The positions of the Training rows.
+            (np.ndarray)    The positions of the Validation rows.
+            (np.ndarray)    The positions of the Testing rows.
+        """
 
         # Create a convenience variable for the remaining code.
         splits = self._split_percentages
 
         # Modified from:
         #   https://stackoverflow.com/questions/40829137/stratified-train-validation-test-split-in-scikit-learn
+        # The splitters only need the answers to stratify on, so work with index arrays and only
+        # build each split from the DataFrame once at the end. The split sizes are computed once
+        # up front so the validation/testing split doesn't depend on rounding in the first split.
+        answers = answers.to_numpy()
+        n_rows = len(answers)
+        n_training = int(n_rows * splits['training'])
+        n_validation = int(n_rows * splits['validation'])
+        n_testing = n_rows - n_training - n_validation
+
         train_other_split = StratifiedShuffleSplit(
             n_splits=1,
-            test_size=(1 - splits['training']),
+            test_size=(n_validation + n_testing),
             random_state=splits['random_seed']
         )
-        for train_index, test_valid_index in train_other_split.split(df, df[self._answers_column]):
-            training_set = df.iloc[train_index]
-            test_valid_set = df.iloc[test_valid_index]
+        train_index, test_valid_index = next(train_other_split.split(np.zeros((n_rows, 1)), answers))
 
+        # Split the remaining index array, rather than a DataFrame, into validation and testing.
+        answers_remaining = answers[test_valid_index]
         validation_test_split = StratifiedShuffleSplit(
             n_splits=1,
-            test_size=(splits['testing'] / (splits['testing'] + splits['validation']))
+            test_size=n_testing,
+            random_state=splits['random_seed']
+        )
+        valid_index, test_index = next(
+            validation_test_split.split(np.zeros((len(answers_remaining), 1)), answers_remaining)
         )
-        for test_index, valid_index in validation_test_split.split(test_valid_set, test_valid_set[self._answers_column]):
-            testing_set = test_valid_set.iloc[test_index]
-            validation_set = test_valid_set.iloc[valid_index]
 
-        testing_answers = testing_set[self._answers_column].copy()
-        self._testing = SplitBase(
-            source=self._source,
-            title=f'{self._title} Testing Dataset',
-            features=testing_set.drop(self._answers_column, axis=1),
-            answers=testing_answers
+        # Map the positions within test_valid_index back to positions within the dataset.
+        return train_index, test_valid_index[valid_index], test_valid_index[test_index]
+
+    def _cached_split_indices(self, answers: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        The split indices only depend on the answers, the split percentages, and the splitting
+        code (_SPLIT_CACHE_VERSION and the scikit-learn version). This method caches them on
+        disk so datasets which are split the same way again just load them. Only the
+        SPLIT_CACHE_SIZE most recently used splits are kept.
+
+        Args:
+            answers:    The answers of the dataset to stratify the splits on.
+
+        Returns:
+            Same as _split_indices.
+        """
+
+        key = hashlib.blake2b(
+            pd.util.hash_pandas_object(answers).to_numpy().tobytes() +
+            repr((_SPLIT_CACHE_VERSION, sklearn.__version__, self._split_percentages)).encode(),
+            digest_size=16
+        ).hexdigest()
+        cache_file = os.path.join(LOCAL_ENV.DIRECTORIES.cache, f'split_{key}.npz')
+
+        if os.path.isfile(cache_file):
+            # Mark it as recently used.
+            os.utime(cache_file)
+            with np.load(cache_file) as indices:
+                return indices['training'], indices['validation'], indices['testing']
+
+        train_index, valid_index, test_index = self._split_indices(answers=answers)
+
+        os.makedirs(LOCAL_ENV.DIRECTORIES.cache, exist_ok=True)
+        np.savez(cache_file, training=train_index, validation=valid_index, testing=test_index)
+
+        # Evict the least recently used splits.
+        cache_files = sorted(
+            glob.glob(os.path.join(LOCAL_ENV.DIRECTORIES.cache, 'split_*.npz')),
+            key=os.path.getmtime
         )
-        validation_answers = validation_set[self._answers_column].copy()
-        self._validation = SplitBase(
-            source=self._source,
-            title=f'{self._title} Validation Dataset',
-            features=validation_set.drop(self._answers_column, axis=1),
-            answers=validation_answers
+        for old_file in cache_files[:-self.SPLIT_CACHE_SIZE]:
+            os.remove(old_file)
+
+        return train_index, valid_index, test_index
+
+    def _split(self):
+        """
+        This method splits the full dataset into the Training, Validation, and Testing datasets.
+
+        Returns:
+            N/A - instance variables are set.
+        """
+
+        # Only keep/split the data that was requested.
+        df = self._downcast(self._full[self._column_headers + [self._answers_column]])
+
+        features = df[self._column_headers]
+        answers = df[self._answers_column]
+
+        train_index, valid_index, test_index = self._cached_split_indices(answers=answers)
+
+        if _is_numeric(features):
+            # Convert the features into a single column-major float32 array once. Each split
+            # is then sliced straight out of it rather than out of the DataFrame.
+            feature_block = np.asfortranarray(features.to_numpy(dtype=np.float32))
+        else:
+            feature_block = None
+
+        self._testing = self._create_split(
+            name='Testing',
+            split_index=test_index,
+            features=features,
+            feature_block=feature_block,
+            answers=answers,
+        )
+        self._validation = self._create_split(
+            name='Validation',
+            split_index=valid_index,
+            features=features,
+            feature_block=feature_block,
+            answers=answers,
+        )
+        self._training = self._create_split(
+            name='Training',
+            split_index=train_index,
+            features=features,
+            feature_block=feature_block,
+            answers=answers,
         )
-        training_answers = training_set[self._answers_column].copy()
-        self._training = SplitBase(
+
+    def _create_split(
+            self,
+            name: str,
+            split_index: np.ndarray,
+            features: pd.DataFrame,
+            feature_block: [np.ndarray, None],
+            answers: pd.Series,
+    ) -> SplitBase:
+        """
+        This method creates one of the Training, Validation, or Testing datasets.
+
+        Args:
+            name:           The name of the split, i.e. Training, Validation, or Testing.
+            split_index:    The positions of the rows in the split.
+            features:       The features of the full dataset.
+            feature_block:  The features of the full dataset as a numeric array or None if
+                            the features aren't all numeric.
+            answers:        The answers of the full dataset.
+
+        Returns:
+            (SplitBase) The split.
+        """
+
+        if feature_block is None:
+            split_features = features.take(split_index)
+        else:
+            split_features = feature_block[split_index]
+
+        return SplitBase(
             source=self._source,
-            title=f'{self._title} Training Dataset',
-            features=training_set.drop(self._answers_column, axis=1),
-            answers=training_answers
+            title=f'{self._title} {name} Dataset',
+            features=split_features,
+            answers=answers.take(split_index),
+            feature_names=list(features.columns),
+            index=features.index[split_index],
         )
 
     @property
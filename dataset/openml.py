@@ -33,13 +33,203 @@ TODOs:
 """
 
 # Standard library imports
+import os
+import glob
+import time
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import timedelta
+from functools import lru_cache
+import joblib
 import pandas as pd
 import requests
+import sklearn
 from sklearn.datasets import fetch_openml
 
 # Tool imports
-import utils
-from dataset.base import SplitBase, DatasetBase
+from local_config import LOCAL_ENV
+from dataset.base import SplitBase, DatasetBase, _SPLIT_CACHE_VERSION
+
+
+_DESCRIPTION_URL = 'https://api.openml.org/api/v1/json/data/{}'
+_REQUEST_TIMEOUT = 10
+_REQUEST_TRIES = 3
+
+# Change this whenever the contents of the cached datasets change so old caches aren't used. That
+# includes the dtypes of the full dataset and the __slots__ of the pickled splits.
+_DATASET_CACHE_VERSION = 'v2'
+
+# The cached datasets can be large, so only keep the most recently used ones.
+_DATASET_CACHE_SIZE = 16
+
+
+@lru_cache(maxsize=None)
+def _session():
+    """
+    Create the session used to request dataset descriptions. The dataset descriptions rarely
+    change, so they are served from a local sqlite cache rather than asking OpenML every time.
+    The session is only created once a description is needed, so importing this module doesn't
+    touch the disk or require requests_cache.
+
+    Returns:
+        (requests_cache.CachedSession) The shared session.
+    """
+
+    import requests_cache
+
+    return requests_cache.CachedSession(
+        cache_name=os.path.join(LOCAL_ENV.DIRECTORIES.cache, 'openml_meta'),
+        backend='sqlite',
+        expire_after=timedelta(days=30),
+    )
+
+
+@lru_cache(maxsize=None)
+def _cached_fetch():
+    """
+    Downloading and parsing a dataset from OpenML is by far the slowest part of creating a
+    Dataset, so _fetch is wrapped to keep its results on disk. Like _session, this is only done
+    once a dataset is needed.
+
+    Returns:
+        (joblib.memory.MemorizedFunc) _fetch with its results cached on disk.
+    """
+
+    memory = joblib.Memory(os.path.join(LOCAL_ENV.DIRECTORIES.cache, 'openml'), verbose=0)
+    return memory.cache(_fetch)
+
+
+def _fetch(data_id: int, as_frame: bool = True) -> tuple:
+    """
+    Fetch an OpenML dataset. Use it through _cached_fetch so each dataset is only downloaded
+    and parsed once.
+
+    Args:
+        data_id:    The ID given to the dataset by OpenML.
+        as_frame:   If True, fetch_openml builds the DataFrame with a dtype per column. If False,
+                    fetch_openml returns a NumPy array which is only wrapped in a DataFrame
+                    afterwards. That is faster and uses less memory for purely numeric datasets.
+
+    Returns:
+        (tuple) The features (DataFrame) and answers (Series, DataFrame, or None).
+    """
+
+    # The pandas parser is much faster than the pure python liac-arff parser.
+    if as_frame is True:
+        return fetch_openml(data_id=data_id, return_X_y=True, as_frame=True, parser='pandas')
+
+    # return_X_y would drop the column names, so take them from the Bunch instead.
+    bunch = fetch_openml(data_id=data_id, as_frame=False, parser='pandas')
+    df_X = pd.DataFrame(bunch.data, columns=bunch.feature_names, copy=False)
+
+    if bunch.target is None:
+        df_y = None
+    elif bunch.target.ndim == 1:
+        df_y = pd.Series(bunch.target, name=bunch.target_names[0], copy=False)
+    else:
+        df_y = pd.DataFrame(bunch.target, columns=bunch.target_names, copy=False)
+
+    return df_X, df_y
+
+
+def _fetch_description(data_id: int) -> dict:
+    """
+    Fetch the description of an OpenML dataset. OpenML occasionally fails requests (e.g. 502s)
+    so the request is retried a few times before giving up.
+
+    Args:
+        data_id:    The ID given to the dataset by OpenML.
+
+    Returns:
+        (dict)  The dataset description.
+    """
+
+    for attempt in range(_REQUEST_TRIES):
+        try:
+            res = _session().get(_DESCRIPTION_URL.format(data_id), timeout=_REQUEST_TIMEOUT)
+            res.raise_for_status()
+            return res.json()['data_set_description']
+        except requests.RequestException:
+            if attempt == _REQUEST_TRIES - 1:
+                raise
+
+            time.sleep(1)
+
+
+def _fetch_description_and_data(data_id: int, as_frame: bool = True) -> tuple[dict, tuple]:
+    """
+    Fetch the description and the data of an OpenML dataset. These are independent downloads,
+    so when neither is cached they are downloaded at the same time.
+
+    Args:
+        data_id:    The ID given to the dataset by OpenML.
+        as_frame:   Same as _fetch.
+
+    Returns:
+        (dict)  The dataset description.
+        (tuple) The features and answers as returned by _fetch.
+    """
+
+    if (
+            _session().cache.contains(url=_DESCRIPTION_URL.format(data_id))
+            or _cached_fetch().check_call_in_cache(data_id, as_frame)
+    ):
+        # At most one download is needed, so there is nothing to gain from threads.
+        return _fetch_description(data_id), _cached_fetch()(data_id, as_frame)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        description = executor.submit(_fetch_description, data_id)
+        data = executor.submit(_cached_fetch(), data_id, as_frame)
+
+        return description.result(), data.result()
+
+
+@dataclass(frozen=True)
+class _Inputs:
+    """
+    This class holds the instantiation args of a Dataset so it can be recreated.
+    """
+
+    id: int
+    column_headers: list[str]
+    answers_column: str
+    split_percentages: dict
+    as_frame: bool = True
+
+
+def _dataset_cache_file(
+        data_id: int,
+        column_headers: list[str],
+        answers_column: str,
+        split_percentages: dict,
+        as_frame: bool = True
+) -> str:
+    """
+    Determine the file which caches the fully processed Dataset for these instantiation args.
+    The cached splits bypass DatasetBase._cached_split_indices, so the key covers the same
+    splitting code versions it does.
+
+    Args:
+        Same as Dataset.
+
+    Returns:
+        (str)   Full path and file name of the cache file.
+    """
+
+    key = repr((
+        _DATASET_CACHE_VERSION,
+        _SPLIT_CACHE_VERSION,
+        sklearn.__version__,
+        str(data_id),
+        list(column_headers),
+        answers_column,
+        sorted(split_percentages.items()),
+        as_frame,
+    ))
+    key = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    return os.path.join(LOCAL_ENV.DIRECTORIES.cache, f'openml_{data_id}_{key}.pkl')
 
 
 class Split(SplitBase):
@@ -49,6 +239,8 @@ class Split(SplitBase):
     API.
     """
 
+    __slots__ = ()
+
 
 class Dataset(DatasetBase):
     """
@@ -59,12 +251,15 @@ class Dataset(DatasetBase):
     repeating potentially time-consuming calculations.
     """
 
+    __slots__ = ('_data_id', '_cache_file', '_cached_dataset', '_fetched_data')
+
     def __init__(
             self,
             id: int,
             column_headers: list[str],
             answers_column: str,
-            split_percentages: dict
+            split_percentages: dict,
+            as_frame: bool = True
     ):
         """
         Instantiate the class.
@@ -77,18 +272,37 @@ class Dataset(DatasetBase):
             answers_column:         The column header for the answers (if this is supervised learning).
             split_percentages:      A dict with keys 'training', 'validation', and 'testing' where each
                                     key have a value [0, 1) and the sum of all values = 1.
+            as_frame:               If True (default), OpenML data is parsed straight into a DataFrame
+                                    with a dtype per column. If False, it is parsed into a NumPy array
+                                    first, which is faster and uses less memory for purely numeric
+                                    datasets. For mixed datasets every column becomes an object column.
         """
 
-        tmp_locals = locals()
-
-        res = requests.get(f'https://api.openml.org/api/v1/json/data/{id}')
-        dataset_description = res.json()['data_set_description']
-
         self._data_id = id
 
+        # Fetching, cleaning, normalizing, and splitting the dataset always gives the same result
+        # for the same args. So if this was done before, load the result and skip all of that.
+        self._cache_file = _dataset_cache_file(
+            data_id=id,
+            column_headers=column_headers,
+            answers_column=answers_column,
+            split_percentages=split_percentages,
+            as_frame=as_frame,
+        )
+        if os.path.isfile(self._cache_file):
+            # Mark it as recently used.
+            os.utime(self._cache_file)
+            self._cached_dataset, self._fetched_data = joblib.load(self._cache_file), None
+            source, title = self._cached_dataset['source'], self._cached_dataset['title']
+        else:
+            self._cached_dataset = None
+            dataset_description, self._fetched_data = _fetch_description_and_data(id, as_frame)
+            source = f'OpenML_{dataset_description["name"]}_{dataset_description["id"]}_{dataset_description["upload_date"]}'
+            title = f'OpenML_{dataset_description["name"]}_{dataset_description["id"]}'
+
         super().__init__(
-            source=f'OpenML_{dataset_description["name"]}_{dataset_description["id"]}_{dataset_description["upload_date"]}',
-            title=f'OpenML_{dataset_description["name"]}_{dataset_description["id"]}',
+            source=source,
+            title=title,
             column_headers=column_headers,
             answers_column=answers_column,
             split_percentages=split_percentages,
@@ -96,7 +310,13 @@ class Dataset(DatasetBase):
 
         # Override the self._inputs set by __init__ in DatasetBase as this won't allow anyone to
         # recreate the class.
-        self._inputs = tmp_locals
+        self._inputs = _Inputs(
+            id=id,
+            column_headers=column_headers,
+            answers_column=answers_column,
+            split_percentages=split_percentages,
+            as_frame=as_frame,
+        )
 
     def _create_dataset(self):
         """
@@ -113,14 +333,24 @@ class Dataset(DatasetBase):
         # and anything that is necessary (like dropping columns) prior to being split.
         # Then call self._split().
 
-        df_X, df_y = fetch_openml(data_id=self._data_id, return_X_y=True)
+        if self._cached_dataset is not None:
+            cached, self._cached_dataset = self._cached_dataset, None
+            self._column_headers = cached['column_headers']
+            self._full = cached['full']
+            self._training = cached['training']
+            self._validation = cached['validation']
+            self._testing = cached['testing']
+            return
+
+        # The data was fetched along with the dataset description in __init__.
+        (df_X, df_y), self._fetched_data = self._fetched_data, None
 
         if df_y is not None:
             # Combine features + answers since that is what DatasetBase is expecting.
             df_X[self._answers_column] = df_y.copy()
 
         if len(self._column_headers) == 0:
-            self._column_headers = list(self._full.columns)
+            self._column_headers = list(df_X.columns)
 
         try:
             self._column_headers.remove(self._answers_column)
@@ -128,6 +358,29 @@ class Dataset(DatasetBase):
             # The answers column wasn't in the column headers.
             pass
 
+        # _split downcasts the columns it keeps, so there is no need to do it here too.
         self._full = df_X
 
         self._split()
+
+        os.makedirs(LOCAL_ENV.DIRECTORIES.cache, exist_ok=True)
+        joblib.dump(
+            {
+                'source': self._source,
+                'title': self._title,
+                'column_headers': self._column_headers,
+                'full': self._full,
+                'training': self._training,
+                'validation': self._validation,
+                'testing': self._testing,
+            },
+            self._cache_file
+        )
+
+        # Evict the least recently used datasets.
+        cache_files = sorted(
+            glob.glob(os.path.join(LOCAL_ENV.DIRECTORIES.cache, 'openml_*.pkl')),
+            key=os.path.getmtime
+        )
+        for old_file in cache_files[:-_DATASET_CACHE_SIZE]:
+            os.remove(old_file)
@@ -34,25 +34,15 @@ TODOs:
 """
 
 # Standard library imports
-from matplotlib import pyplot as plt
-import plotly.io as pio
-import os
-import platform
+import sys
 from dataclasses import dataclass, field
+from pathlib import Path
 
 # Tool imports
 
 
-plt.style.use('fivethirtyeight')
-
-# Render plotly interactive plots in a browser.
-pio.renderers.default = 'browser'
-
-# Render the plots inline for Spyder.
-# pio.renderers.default = 'svg'
-
 # Automatically determine where the directory of this file.
-base_dir = os.path.dirname(__file__) + os.sep
+base_dir = Path(__file__).resolve().parent
 print(f'Machine Learning Base Directory: {base_dir}')
 
 
@@ -65,13 +55,13 @@ class Directories:
         https://www.pythontutorial.net/python-oop/python-dataclass/
     """
 
-    base: str = base_dir
-    cache: str = field(init=False)
-    configs: str = os.path.join(base_dir, 'configs')
-    dataset: str = os.path.join(base_dir, 'dataset')
-    docs: str = os.path.join(base_dir, 'docs')
-    graphics: str = os.path.join(base_dir, 'graphics')
-    examples: str = os.path.join(base_dir, 'examples')
+    base: Path = base_dir
+    cache: Path = field(init=False)
+    configs: Path = base_dir / 'configs'
+    dataset: Path = base_dir / 'dataset'
+    docs: Path = base_dir / 'docs'
+    graphics: Path = base_dir / 'graphics'
+    examples: Path = base_dir / 'examples'
 
     def __post_init__(self):
         """
@@ -83,12 +73,11 @@ class Directories:
         """
 
         # Can't do this because it is frozen.
-        # self.cache = os.path.join(self.data, 'cache')
+        # self.cache = self.base / 'cache'
 
         # So we work around it like this:
         #   https://stackoverflow.com/questions/53756788/how-to-set-the-value-of-dataclass-field-in-post-init-when-frozen-true
-        # object.__setattr__(self, 'results', os.path.join(self.data, 'results'))
-        pass
+        object.__setattr__(self, 'cache', self.base / 'cache')
 
 
 # DIRECTORIES is capitalized because it should be treated as a constant outside this file.
@@ -101,9 +90,31 @@ class LocalEnv:
     This class holds all local env values in a read-only class.
     """
 
-    OS_IS_WINDOWS: bool = 'Windows' in platform.platform()
+    OS_IS_WINDOWS: bool = sys.platform.startswith('win')
     DIRECTORIES: Directories = DIRECTORIES
 
 
 # It is recommended that you use only the class(es) below.
 LOCAL_ENV = LocalEnv()
+
+
+def configure_plotting():
+    """
+    Set the plotting preferences. The plotting libraries are imported here, rather than at the
+    top of the file, so code which only needs LOCAL_ENV doesn't pay to load them. Call this
+    from an entry point before plotting.
+
+    Returns:
+        N/A
+    """
+
+    from matplotlib import pyplot as plt
+    import plotly.io as pio
+
+    plt.style.use('fivethirtyeight')
+
+    # Render plotly interactive plots in a browser.
+    pio.renderers.default = 'browser'
+
+    # Render the plots inline for Spyder.
+    # pio.renderers.default = 'svg'
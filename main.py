@@ -38,6 +38,7 @@ TODOs:
 
 # Tool imports
 import configs
+from local_config import configure_plotting
 
 
 def execute_exploratory_analysis(config_file: str):
@@ -50,6 +51,8 @@ def execute_exploratory_analysis(config_file: str):
 
     """
 
+    configure_plotting()
+
     config = configs.Config(config_file=config_file)
 
     # Steps - see the notes/Kozyrkov_12steps.md
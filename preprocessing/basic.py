@@ -35,10 +35,10 @@ TODOs:
 
 # Standard library imports
 from sklearn.pipeline import Pipeline
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.feature_extraction.text import HashingVectorizer
 from sklearn.preprocessing import StandardScaler, MinMaxScaler
-from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.pipeline import FeatureUnion
+from sklearn.base import BaseEstimator, TransformerMixin, clone
+from sklearn.compose import ColumnTransformer
 import pandas as pd
 
 # Tool imports
@@ -79,31 +79,43 @@ class NumberSelector(BaseEstimator, TransformerMixin):
 
 # This class was modified from: https://stackoverflow.com/questions/68402691/adding-dropping-column-instance-into-a-pipeline
 class ColumnDropper(BaseEstimator, TransformerMixin):
-    def __init__(self, columns: list[str]):
+    def __init__(self, columns: list[str], copy: bool = True):
         """
 
         Args:
-            columns:
+            columns:    The columns to drop.
+            copy:       If False, the columns are dropped from X in place rather than from
+                        a copy. Only use this when X isn't needed again after the transform.
         """
 
-        self._columns_to_drop = columns
+        self.columns = columns
+        self.copy = copy
 
     def transform(self, X: pd.DataFrame, y: [pd.DataFrame, None] = None):
-        return X.drop(self._columns_to_drop, axis=1)
+        # resolved_columns_ is the subset of columns which are actually in the data. Set by fit.
+        columns = getattr(self, 'resolved_columns_', self.columns)
+
+        if self.copy is False:
+            X.drop(columns=columns, inplace=True, errors='ignore')
+            return X
+
+        return X.drop(columns=columns, errors='ignore')
 
     def fit(self, X: pd.DataFrame, y: [pd.DataFrame, None] = None):
+        self.resolved_columns_ = [col for col in self.columns if col in X.columns]
         return self
 
 
 class Basic:
     """
-    Very basic (minimal) preprocessing pipeline which will extract each column, determine
-    if it is text or numbers, select the column, and apply a scaling object to it.
+    Very basic (minimal) preprocessing pipeline which will determine if each column is text or
+    numbers. All numeric columns are scaled together by the number scaler and each text column
+    is vectorized by its own copy of the text scaler.
     """
 
     def __init__(
             self,
-            text_scaler=TfidfVectorizer(stop_words='english'),
+            text_scaler=HashingVectorizer(n_features=2 ** 18, alternate_sign=False, stop_words='english'),
             number_scaler=StandardScaler(),
             null_threshold=1.
     ):
@@ -111,7 +123,9 @@ class Basic:
         Instantiate the class.
 
         Args:
-            text_scaler:    The method to vectorize/scale text columns.
+            text_scaler:    The method to vectorize/scale text columns. The default hashes the
+                            words rather than learning a vocabulary, so fitting it is free
+                            and every text column has the same fixed width.
             number_scaler:  The method to scale numeric columns.
             null_threshold: Percent [0, 1] of the column which can be null. Equal to
                             or above this percentage and the column gets dropped. This
@@ -165,32 +179,41 @@ class Basic:
                         feature engineering.
         """
 
-        null_table = self._null_analysis(df=df)
-        high_null_table = null_table[null_table['percentage'] >= self.null_threshold]
-        bad_columns = list(high_null_table.index)
+        # Only the columns over the threshold are needed here, so skip building the full
+        # _null_analysis table and reduce the null mask directly.
+        bad_columns = df.columns[df.isna().to_numpy().mean(axis=0) >= self.null_threshold].tolist()
+
+        # Determine the column types from the dtypes all at once. Only columns with some other
+        # dtype (e.g. category) need their values checked.
+        text_columns = set(df.select_dtypes(include=['object', 'string']).columns)
+        number_columns = set(df.select_dtypes(include='number').columns)
 
-        column_pipelines = []
+        text_transformers, numeric_block = [], []
         for col in df.columns:
-            if isinstance(df[col][0], str):
-                pipeline = Pipeline(
-                    [
-                        ('selector', TextSelector(key=col)),
-                        ('tfidf', self.text_scaler)
-                    ]
-                )
+            if col in bad_columns:
+                # This gets dropped before the scaling.
+                continue
+
+            if col in text_columns:
+                is_text = True
+            elif col in number_columns:
+                is_text = False
+            else:
+                is_text = len(df) > 0 and isinstance(df[col].iloc[0], str)
+
+            if is_text:
+                # Text vectorizers only take a single column, so each text column gets its own
+                # copy of the text scaler.
+                text_transformers.append((f'text_{col}', clone(self.text_scaler), col))
             else:
-                pipeline = Pipeline(
-                    [
-                        ('selector', NumberSelector(key=col)),
-                        ('scaler', self.number_scaler)
-                    ]
-                )
+                numeric_block.append(col)
 
-            column_pipelines.append((col, pipeline))
+        # All the numeric columns are scaled as one block by a single scaler.
+        transformers = [('numbers', clone(self.number_scaler), numeric_block)] + text_transformers
 
         return Pipeline([
             ('remove_too_many_nulls', ColumnDropper(bad_columns)),
-            ('preprocessing', FeatureUnion(column_pipelines))
+            ('preprocessing', ColumnTransformer(transformers, n_jobs=-1))
         ])
 
     @property
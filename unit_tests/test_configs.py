@@ -0,0 +1,274 @@
+"""
+Module:
+    test_configs.py
+
+Description:
+    Unit tests for the Config and LazyConfig classes in configs. Each test writes its own json
+    config files to a temporary directory and parses them.
+
+Usage:
+    python -m unittest discover -s unit_tests -t .
+
+Notes:
+
+
+References:
+
+
+License:
+    https://creativecommons.org/licenses/by-nc-nd/4.0/
+    Attribution-NonCommercial-NoDerivatives 4.0 International (CC BY-NC-ND 4.0)
+    See LICENSE.txt
+
+"""
+
+"""
+Version History:
+    Original:
+        Gabe Spradlin | 14-Oct-2026
+"""
+
+"""
+TODOs:
+    1)
+"""
+
+# Standard library imports
+import json
+import os
+import tempfile
+import unittest
+from collections import Counter, OrderedDict, defaultdict
+
+# Tool imports
+from configs import Config, LazyConfig
+
+
+class Recorder:
+    """
+    Records every instance which gets created so the tests can tell when objects are instantiated.
+    It also appends to its list arg to check that the config isn't changed by the constructors.
+    """
+
+    created = []
+
+    def __init__(self, values: list = None, child=None):
+        self.values = values
+        self.child = child
+        if values is not None:
+            values.append('added')
+
+        Recorder.created.append(self)
+
+
+class DictRecorder(OrderedDict):
+    """
+    An instantiated object which is also a dict.
+    """
+
+
+def make_defaultdict(n: int) -> defaultdict:
+    output = defaultdict(list)
+    output['n'] = n
+    return output
+
+
+def object_config(class_name: str, args: dict, module: str = __name__) -> dict:
+    return {'object': {'module': module, 'class': class_name, 'args': args}}
+
+
+def find_key(config, key: str) -> bool:
+    # Check every level of config for key.
+    stack = [config]
+    while len(stack) > 0:
+        sub_config = stack.pop()
+        if key in sub_config:
+            return True
+
+        stack.extend(v for v in dict.values(sub_config) if type(v) is dict)
+
+    return False
+
+
+class TestConfig(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        Recorder.created = []
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def write(self, file_name: str, config: dict) -> str:
+        file_name = os.path.join(self._directory.name, file_name)
+        with open(file_name, 'w') as f:
+            json.dump(config, f)
+
+        return file_name
+
+    def test_references_are_replaced_and_overridden(self):
+        grandchild = self.write('grandchild.json', object_config('Recorder', {'values': [1]}))
+        child = self.write('child.json', {'recorder': {'reference': grandchild}, 'name': 'child'})
+        dataset = self.write('dataset.json', object_config('Recorder', {'values': [], 'child': None}))
+        top = self.write('top.json', {
+            '__comments': {'notes': 'Comments are left alone.'},
+            'child': {'reference': child},
+            'dataset': {'reference': dataset, 'override': {'values': [2, 3]}},
+        })
+
+        config = Config(config_file=top)
+
+        parsed = config.parsed
+        self.assertEqual(parsed['__comments'], {'notes': 'Comments are left alone.'})
+        self.assertEqual(parsed['child']['source'], child)
+        self.assertEqual(parsed['child']['name'], 'child')
+        self.assertEqual(parsed['child']['recorder']['source'], grandchild)
+        self.assertEqual(parsed['child']['recorder']['object']['args'], {'values': [1]})
+        self.assertIs(parsed['child']['recorder']['object']['object_'], Recorder)
+        self.assertEqual(parsed['dataset']['object']['args'], {'values': [2, 3], 'child': None})
+        self.assertFalse(find_key(parsed, 'reference'))
+        self.assertFalse(find_key(parsed, Config.RESOLVED_TAG))
+
+        # Parsing doesn't change the raw config.
+        self.assertEqual(config.raw['dataset'], {'reference': dataset, 'override': {'values': [2, 3]}})
+
+    def test_directory_placeholders_are_replaced(self):
+        top = self.write('top.json', {'preprocessing': {'reference': '$configs$/preprocessing_example.json'}})
+
+        config = Config(config_file=top)
+
+        self.assertEqual(config.parsed['preprocessing']['source'], '$configs$/preprocessing_example.json')
+        self.assertFalse(find_key(config.parsed, 'reference'))
+
+    def test_deeply_nested_configs_are_parsed(self):
+        # The levels are walked with explicit stacks, and every level has to come out parsed.
+        depth = 200
+        file_name = os.path.join(self._directory.name, 'top.json')
+        with open(file_name, 'w') as f:
+            f.write('{"level": ' * depth + json.dumps(object_config('Recorder', {})) + '}' * depth)
+
+        config = Config(config_file=file_name)
+
+        parsed = config.parsed
+        for _ in range(depth):
+            parsed = parsed['level']
+
+        self.assertIs(parsed['object']['object_'], Recorder)
+        self.assertIsInstance(config.instantiated['level']['level']['level'], LazyConfig)
+
+    def test_plain_data_is_not_parsed(self):
+        config = Config(config_file=self.write('top.json', {'split_percentages': {'training': 1.}}))
+
+        self.assertTrue(config._is_plain_data({'training': 0.7, 'testing': 0.3}))
+        self.assertFalse(config._is_plain_data({'reference': 'other.json'}))
+        self.assertFalse(config._is_plain_data(object_config('Recorder', {})))
+        self.assertEqual(config.parsed, {'split_percentages': {'training': 1.}})
+
+    def test_referenced_files_are_read_once(self):
+        shared = self.write('shared.json', object_config('Recorder', {}))
+        top = self.write('top.json', {
+            'first': {'reference': shared},
+            'second': {'reference': shared},
+            'other': {'reference': self.write('other.json', {'name': 'other'})},
+        })
+
+        config = Config(config_file=top)
+
+        # Every referenced file was prefetched into the file cache.
+        self.assertEqual(
+            set(config._file_cache),
+            {os.path.realpath(os.path.join(self._directory.name, f)) for f in ('top.json', 'shared.json', 'other.json')}
+        )
+
+        # Once cached, the files aren't read from disk again.
+        os.remove(shared)
+        self.assertEqual(config.load_json_file(shared), object_config('Recorder', {}))
+
+        # The cached dict isn't shared with the callers.
+        config.load_json_file(shared)['object']['args']['values'] = []
+        self.assertEqual(config.load_json_file(shared), object_config('Recorder', {}))
+
+    def test_classes_are_looked_up_once(self):
+        config = Config(config_file=self.write('top.json', {'a': object_config('Counter', {}, module='collections')}))
+
+        self.assertIs(config._class_cache[('collections', 'Counter')], Counter)
+        self.assertIs(config.parsed['a']['object']['object_'], Counter)
+
+
+class TestLazyConfig(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        Recorder.created = []
+
+        config = {
+            'first': object_config('Recorder', {'values': []}),
+            'second': object_config('Recorder', {'values': [], 'child': object_config('Recorder', {'values': [1]})}),
+            'ordered': object_config('DictRecorder', {'a': 1}),
+            'default': object_config('make_defaultdict', {'n': 2}),
+            'counter': object_config('Counter', {'x': 3}, module='collections'),
+        }
+        file_name = os.path.join(self._directory.name, 'top.json')
+        with open(file_name, 'w') as f:
+            json.dump(config, f)
+
+        self._config = Config(config_file=file_name)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_objects_are_instantiated_on_access(self):
+        lazy = self._config.lazy
+        self.assertIsInstance(lazy, LazyConfig)
+        self.assertEqual(Recorder.created, [])
+
+        instance = lazy['first']['object']['instance']
+        self.assertIsInstance(instance, Recorder)
+        self.assertEqual(Recorder.created, [instance])
+
+        # Accessing it again doesn't create another one.
+        self.assertIs(lazy.get('first')['object']['instance'], instance)
+        self.assertEqual(len(Recorder.created), 1)
+
+    def test_every_access_path_instantiates(self):
+        for k, v in self._config.lazy.items():
+            self.assertIn('instance', v['object'], k)
+
+        for v in self._config.lazy.values():
+            self.assertIn('instance', v['object'])
+
+        self.assertIn('instance', dict(self._config.lazy)['first']['object'])
+        self.assertIn('instance', {**self._config.lazy}['first']['object'])
+        self.assertIn('instance', self._config.lazy.pop('ordered')['object'])
+
+    def test_materialize_instantiates_everything(self):
+        instantiated = self._config.instantiated
+
+        second = instantiated['second']['object']
+        child = second['args']['child']['object']['instance']
+        self.assertEqual(len(Recorder.created), 3)
+        self.assertIs(second['instance'].child['object']['instance'], child)
+        self.assertEqual(child.values, [1, 'added'])
+
+    def test_instances_keep_their_types(self):
+        instantiated = self._config.instantiated
+
+        self.assertIs(type(instantiated['ordered']['object']['instance']), DictRecorder)
+        self.assertIs(type(instantiated['counter']['object']['instance']), Counter)
+        self.assertIs(type(self._config.lazy['default']['object']['instance']), defaultdict)
+        self.assertEqual(instantiated['default']['object']['instance']['missing'], [])
+
+    def test_constructors_do_not_change_the_config(self):
+        self._config.instantiated
+
+        self.assertEqual(self._config.raw['second']['object']['args']['values'], [])
+        self.assertEqual(self._config.parsed['second']['object']['args']['values'], [])
+        self.assertEqual(
+            self._config.parsed['second']['object']['args']['child']['object']['args']['values'],
+            [1]
+        )
+        self.assertNotIn('instance', self._config.parsed['first']['object'])
+
+
+if __name__ == '__main__':
+    unittest.main()
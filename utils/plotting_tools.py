@@ -35,7 +35,8 @@ TODOs:
 """
 
 # Standard Library Imports
-from matplotlib import pyplot as plt
+# pyplot is imported inside the functions that use it. This module is imported with utils, and
+# most users of utils (e.g. configs and dataset) never plot, so they shouldn't pay to load it.
 import numpy as np
 
 # Custom Package Imports
@@ -78,6 +79,8 @@ DEFAULT_PLOT_COLORS = [
 
 def create_new_figure(figsize: tuple = DEFAULT_FIGURE_SIZE, is_3d: bool = False) -> dict:
     # This function simply creates a new figure with the provided size.
+    from matplotlib import pyplot as plt
+
     if is_3d is False:
         fig, ax = plt.subplots(figsize=figsize)
     else:
@@ -93,6 +96,8 @@ def create_new_figure_with_1_column_of_axes(
 ) -> dict:
     # This function creates a new figure with the number of subplot axes requested.
     # All subplots will are in a single column, meaning 1 is above the other.
+    from matplotlib import pyplot as plt
+
     fig, axs = plt.subplots(figsize=figsize, nrows=number_of_axes)
 
     # The subplots are all in a tuple. Let's break them out and give them slightly
@@ -110,6 +115,8 @@ def create_new_figure_with_1_row_of_axes(
 ) -> dict:
     # This function creates a new figure with the number of subplot axes requested.
     # All subplots will are in a single row, meaning 1 is to the left of the other.
+    from matplotlib import pyplot as plt
+
     fig, axs = plt.subplots(figsize=figsize, ncols=number_of_axes)
 
     # The subplots are all in a tuple. Let's break them out and give them slightly
@@ -128,6 +135,8 @@ def create_new_figure_with_grid_of_axes(
 ) -> dict:
     # This function creates a new figure with the number of subplot axes requested.
     # All subplots will are in a single row, meaning 1 is to the left of the other.
+    from matplotlib import pyplot as plt
+
     fig, axs = plt.subplots(figsize=figsize, ncols=number_of_cols, nrows=number_of_rows)
 
     # The subplots are all in a tuple. Let's break them out and give them slightly
@@ -29,9 +29,46 @@ TODOs:
 """
 
 # Standard library imports
-
+import re
+from functools import lru_cache
 
 # Tool imports
+import numpy as np
+
+
+# Below this length the regex is quicker than the setup cost of the NumPy scan.
+_VECTORIZED_MIN_LENGTH = 256
+
+
+@lru_cache(maxsize=64)
+def _repeats_pattern(needle: str) -> re.Pattern:
+    """
+    Compile a regex matching 1 or more back to back instances of needle.
+
+    Args:
+        needle:     Substring to match.
+
+    Returns:
+        (re.Pattern) The compiled regex.
+    """
+
+    return re.compile(f'(?:{re.escape(needle)})+')
+
+
+@lru_cache(maxsize=64)
+def _overlaps_itself(needle: str) -> bool:
+    """
+    Determine if 2 instances of needle can overlap, i.e. needle starts with one of its endings
+    like 'aba' does.
+
+    Args:
+        needle:     Substring to check.
+
+    Returns:
+        (bool) True if some proper prefix of needle is also a suffix of needle.
+    """
+
+    return any(needle[:i] == needle[-i:] for i in range(1, len(needle)))
 
 
 def deduplicate(haystack: str, needle: str):
@@ -48,10 +85,32 @@ def deduplicate(haystack: str, needle: str):
     """
 
     # From: https://stackoverflow.com/questions/42216559/fastest-way-to-deduplicate-contiguous-characters-in-string-python
-    if haystack.find(needle * 2) != -1:
-        return deduplicate(haystack.replace(needle * 2, needle), needle)
-
-    return haystack
+    if len(needle) == 0:
+        return haystack
+
+    # A single ASCII needle (the common whitespace/separator case) is collapsed with one
+    # vectorized compare of adjacent bytes: a byte is dropped only if it and the byte before it
+    # are both the needle. UTF-8 continuation bytes are never ASCII, so multibyte text is safe.
+    if len(needle) == 1 and needle.isascii() and len(haystack) >= _VECTORIZED_MIN_LENGTH:
+        arr = np.frombuffer(haystack.encode('utf-8'), dtype=np.uint8)
+        is_needle = arr == ord(needle)
+        keep = np.ones(arr.shape, dtype=bool)
+        keep[1:] = ~(is_needle[1:] & is_needle[:-1])
+        return arr[keep].tobytes().decode('utf-8')
+
+    # When needle overlaps itself (e.g. 'aba'), collapsing runs can leave new doubled needles
+    # behind ('ababaaba' still contains 'abaaba'), so keep replacing until there are none.
+    if _overlaps_itself(needle):
+        doubled = needle * 2
+        while doubled in haystack:
+            haystack = haystack.replace(doubled, needle)
+
+        return haystack
+
+    # Otherwise every run of needles is collapsed to a single needle in one pass. The
+    # replacement is a function so a needle like a Windows path separator isn't treated as an
+    # escape.
+    return _repeats_pattern(needle).sub(lambda match: needle, haystack)
 
 
 def formatted_line(info: str, tab_level: int = 1) -> str:
@@ -127,6 +186,28 @@ def extract_remainder_left_of(full_str: str, search_str: str, include: bool = Fa
         return full_str[:index]
 
 
+@lru_cache(maxsize=256)
+def _between_pattern(left: str, right: str, include: bool) -> re.Pattern:
+    """
+    Compile a regex matching what extract_between returns. The match starts at the 1st left,
+    and the search for right starts at the beginning of left if include is True, or at the end
+    of left otherwise, just like searching the remainder right of left.
+
+    Args:
+        Same as extract_between.
+
+    Returns:
+        (re.Pattern) The compiled regex.
+    """
+
+    if include is True:
+        pattern = f'(?={re.escape(left)}).*?{re.escape(right)}'
+    else:
+        pattern = f'(?<={re.escape(left)}).*?(?={re.escape(right)})'
+
+    return re.compile(pattern, re.DOTALL)
+
+
 def extract_between(full_str: str, left: str, right: str, include: bool = False) -> str:
     """
     Extract everything between the left and right search strings from the full_str and return
@@ -145,5 +226,9 @@ def extract_between(full_str: str, left: str, right: str, include: bool = False)
                 not in full_str then the return is an empty str.
     """
 
-    left_forward = extract_remainder_right_of(full_str=full_str, search_str=left, include=include)
-    return extract_remainder_left_of(full_str=left_forward, search_str=right, include=include)
+    # A single regex search rather than searching for left, slicing, and then searching for right.
+    match = _between_pattern(left, right, include).search(full_str)
+    if match is None:
+        return ''
+
+    return match.group(0)